@@ -6,37 +6,163 @@ Deployable to Streamlit Cloud.
 """
 
 import io
+import re
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.scraper import AVFMSScraper, SeatPhoto
+from src.scraper import AVFMSScraper, SeatPhoto, Section
+
+# Concurrent image downloads when fetching a section's photos
+DOWNLOAD_WORKERS = 16
+
+# Matches what str.isalnum() rejects (underscores are replaced by themselves)
+_UNSAFE_FILENAME_CHARS = re.compile(r"\W")
 
 
 @st.cache_resource
 def get_scraper():
     """Get cached scraper instance."""
-    return AVFMSScraper(delay=0.5)
+    scraper = AVFMSScraper(delay=0.5)
+
+    # Size the connection pool for concurrent downloads so each worker
+    # reuses a kept-alive connection instead of opening a new one
+    adapter = HTTPAdapter(
+        pool_connections=DOWNLOAD_WORKERS * 2,
+        pool_maxsize=DOWNLOAD_WORKERS * 2,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    scraper.session.mount("https://", adapter)
+    scraper.session.mount("http://", adapter)
+    return scraper
+
 
+class _EmptyResult(Exception):
+    """Raised from cached lookups so st.cache_data doesn't keep empty results."""
 
-def fetch_image_bytes(url: str, scraper: AVFMSScraper) -> Optional[bytes]:
-    """Download image and return as bytes."""
+
+def _non_empty(cached_lookup, *args, **kwargs) -> list:
+    """Call a cached lookup, returning [] for empty results without caching them."""
     try:
+        return cached_lookup(*args, **kwargs)
+    except _EmptyResult:
+        return []
+
+
+# The scraper returns [] when a request fails, so empty results aren't cached
+# (st.cache_data doesn't cache exceptions); retrying then refetches
+@st.cache_data(ttl=3600, show_spinner=False)
+def _search_venues(query: str) -> List[dict]:
+    venues = get_scraper().search_venues(query)
+    if not venues:
+        raise _EmptyResult
+    return venues
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_venue_sections(venue_url: str) -> List[Section]:
+    sections = get_scraper().get_venue_sections(venue_url)
+    if not sections:
+        raise _EmptyResult
+    return sections
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_section_photos(section_url: str, venue_name: str, max_photos: int) -> List[SeatPhoto]:
+    photos = get_scraper().get_section_photos(
+        section_url,
+        venue_name=venue_name,
+        max_photos=max_photos
+    )
+    if not photos:
+        raise _EmptyResult
+    return photos
+
+
+def search_venues(query: str) -> List[dict]:
+    """Search venues, caching non-empty results for an hour."""
+    return _non_empty(_search_venues, query)
+
+
+def get_venue_sections(venue_url: str) -> List[Section]:
+    """Get a venue's sections, caching non-empty results for an hour."""
+    return _non_empty(_get_venue_sections, venue_url)
+
+
+def get_section_photos(section_url: str, venue_name: str, max_photos: int) -> List[SeatPhoto]:
+    """Get a section's photos, caching non-empty results for an hour."""
+    return _non_empty(_get_section_photos, section_url, venue_name, max_photos)
+
+
+def fetch_all_image_bytes(
+    photos: List[SeatPhoto],
+    scraper: AVFMSScraper,
+    progress=None,
+    max_workers: int = DOWNLOAD_WORKERS
+) -> Dict[int, bytes]:
+    """
+    Download images for all photos concurrently.
+
+    Args:
+        photos: Photos to download
+        scraper: Scraper whose session is used for the requests
+        progress: Optional st.progress bar, advanced as each download lands
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Dict mapping photo index to image bytes (failed downloads omitted)
+    """
+    photo_bytes = {}
+    if not photos:
+        return photo_bytes
+
+    def download(url: str) -> bytes:
         response = scraper.session.get(url, timeout=30)
         response.raise_for_status()
         return response.content
-    except Exception as e:
-        st.error(f"Failed to download image: {e}")
-        return None
+
+    # Fetch each distinct URL once, then map the bytes back to every photo
+    indices_by_url = {}
+    for idx, photo in enumerate(photos):
+        indices_by_url.setdefault(photo.image_url, []).append(idx)
+
+    # Streamlit calls must stay on the script thread, so workers only do I/O
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(download, url): url
+            for url in indices_by_url
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                img_bytes = future.result()
+            except Exception as e:
+                st.error(f"Failed to download image: {e}")
+            else:
+                if img_bytes:
+                    for idx in indices_by_url[futures[future]]:
+                        photo_bytes[idx] = img_bytes
+            if progress is not None:
+                progress.progress(done / len(futures))
+
+    return photo_bytes
+
+
+def safe_filename(text: str) -> str:
+    """Replace non-alphanumeric characters with underscores."""
+    return _UNSAFE_FILENAME_CHARS.sub("_", text)
 
 
 def create_zip_of_photos(photos: List[Tuple[str, bytes]]) -> bytes:
     """Create a zip file containing all photos."""
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+    # JPEGs are already compressed, so store them rather than deflate
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zf:
         for filename, image_bytes in photos:
             zf.writestr(filename, image_bytes)
     zip_buffer.seek(0)
@@ -59,16 +185,18 @@ def main():
     scraper = get_scraper()
 
     # Initialize session state
-    if "venues" not in st.session_state:
-        st.session_state.venues = []
-    if "sections" not in st.session_state:
-        st.session_state.sections = []
-    if "photos" not in st.session_state:
-        st.session_state.photos = []
-    if "current_venue" not in st.session_state:
-        st.session_state.current_venue = None
-    if "downloaded_images" not in st.session_state:
-        st.session_state.downloaded_images = []
+    defaults = {
+        "venues": [],
+        "venues_by_name": {},
+        "sections": [],
+        "sections_by_label": {},
+        "photos": [],
+        "current_venue": None,
+        "downloaded_images": [],
+        "download_zip": None,
+    }
+    for key, value in defaults.items():
+        st.session_state.setdefault(key, value)
 
     # Sidebar for venue search
     with st.sidebar:
@@ -82,77 +210,82 @@ def main():
 
         if st.button("Search", type="primary") and venue_query:
             with st.spinner("Searching venues..."):
-                venues = scraper.search_venues(venue_query)
+                venues = search_venues(venue_query)
                 st.session_state.venues = venues
+                # Index by name once so reruns don't rescan the list
+                st.session_state.venues_by_name = {}
+                for v in venues:
+                    st.session_state.venues_by_name.setdefault(v["name"], v)
                 st.session_state.sections = []
+                st.session_state.sections_by_label = {}
                 st.session_state.photos = []
                 st.session_state.downloaded_images = []
+                st.session_state.download_zip = None
 
         # Display venue results
         if st.session_state.venues:
             st.subheader("Select Venue")
-            venue_names = [v["name"] for v in st.session_state.venues]
-
             selected_venue_name = st.selectbox(
                 "Venue",
-                options=venue_names,
+                options=list(st.session_state.venues_by_name),
                 key="selected_venue"
             )
 
             if selected_venue_name:
-                selected_venue = next(
-                    (v for v in st.session_state.venues if v["name"] == selected_venue_name),
-                    None
-                )
+                selected_venue = st.session_state.venues_by_name.get(selected_venue_name)
 
                 if selected_venue and st.button("Load Sections"):
                     with st.spinner("Loading sections..."):
-                        sections = scraper.get_venue_sections(selected_venue["url"])
+                        sections = get_venue_sections(selected_venue["url"])
                         st.session_state.sections = sections
+                        # Index sections with photos by their dropdown label
+                        # (first one wins on repeated labels, like the venues)
+                        st.session_state.sections_by_label = {}
+                        for s in sections:
+                            if s.photo_count > 0:
+                                st.session_state.sections_by_label.setdefault(
+                                    f"{s.name} ({s.photo_count} photos)", s
+                                )
                         st.session_state.current_venue = selected_venue
                         st.session_state.photos = []
                         st.session_state.downloaded_images = []
+                        st.session_state.download_zip = None
 
         # Display section selector
         if st.session_state.sections:
             st.subheader("Select Section")
 
-            # Filter to sections with photos
-            sections_with_photos = [s for s in st.session_state.sections if s.photo_count > 0]
-
-            if sections_with_photos:
-                section_options = [f"{s.name} ({s.photo_count} photos)" for s in sections_with_photos]
+            # Sections with photos, keyed by dropdown label
+            sections_by_label = st.session_state.sections_by_label
 
+            if sections_by_label:
                 selected_section_str = st.selectbox(
                     "Section",
-                    options=section_options,
+                    options=list(sections_by_label),
                     key="selected_section"
                 )
 
                 if selected_section_str:
-                    idx = section_options.index(selected_section_str)
-                    selected_section = sections_with_photos[idx]
+                    selected_section = sections_by_label[selected_section_str]
 
                     max_photos = st.slider("Max photos to fetch", 1, 20, 10)
 
                     if st.button("Fetch Photos"):
                         with st.spinner(f"Fetching photos from {selected_section.name}..."):
-                            photos = scraper.get_section_photos(
+                            photos = get_section_photos(
                                 selected_section.url,
                                 venue_name=st.session_state.current_venue["name"],
                                 max_photos=max_photos
                             )
                             st.session_state.photos = photos
                             st.session_state.downloaded_images = []
+                            st.session_state.download_zip = None
 
                             # Pre-fetch image bytes for display (needed for cloud)
-                            st.session_state.photo_bytes = {}
                             progress = st.progress(0)
-                            for idx, photo in enumerate(photos):
-                                img_bytes = fetch_image_bytes(photo.image_url, scraper)
-                                if img_bytes:
-                                    st.session_state.photo_bytes[idx] = img_bytes
-                                progress.progress((idx + 1) / len(photos))
+                            st.session_state.photo_bytes = fetch_all_image_bytes(
+                                photos, scraper, progress=progress
+                            )
                             progress.empty()
             else:
                 st.info("No sections with photos found")
@@ -170,6 +303,7 @@ def main():
     if st.session_state.photos:
         photos = st.session_state.photos
         venue_name = st.session_state.current_venue["name"] if st.session_state.current_venue else "venue"
+        safe_venue = safe_filename(venue_name)
 
         st.subheader(f"📸 {len(photos)} Photos Found")
 
@@ -184,24 +318,24 @@ def main():
                 downloaded = []
                 for idx, photo in enumerate(photos):
                     if idx in photo_bytes:
-                        safe_venue = "".join(c if c.isalnum() else "_" for c in venue_name)
-                        safe_section = "".join(c if c.isalnum() else "_" for c in photo.section)
+                        safe_section = safe_filename(photo.section)
                         filename = f"{safe_venue}_{safe_section}_{idx+1}.jpg"
                         downloaded.append((filename, photo_bytes[idx]))
 
-                st.session_state.downloaded_images = downloaded
+                # Build the zip once here rather than on every rerun; keep
+                # only the filenames so the image bytes aren't held twice
+                st.session_state.download_zip = create_zip_of_photos(downloaded)
+                st.session_state.downloaded_images = [filename for filename, _ in downloaded]
                 st.success(f"Prepared {len(downloaded)} images!")
 
         # Show download button if images are ready
-        if st.session_state.downloaded_images:
-            zip_bytes = create_zip_of_photos(st.session_state.downloaded_images)
+        if st.session_state.downloaded_images and st.session_state.download_zip:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_venue = "".join(c if c.isalnum() else "_" for c in venue_name)
 
             with col2:
                 st.download_button(
                     label=f"⬇️ Download All ({len(st.session_state.downloaded_images)} photos)",
-                    data=zip_bytes,
+                    data=st.session_state.download_zip,
                     file_name=f"{safe_venue}_reference_images_{timestamp}.zip",
                     mime="application/zip"
                 )
@@ -235,8 +369,7 @@ def main():
 
                 # Individual download button - use pre-fetched bytes
                 if idx in photo_bytes:
-                    safe_venue = "".join(c if c.isalnum() else "_" for c in venue_name)
-                    safe_section = "".join(c if c.isalnum() else "_" for c in photo.section)
+                    safe_section = safe_filename(photo.section)
                     filename = f"{safe_venue}_{safe_section}_{idx+1}.jpg"
 
                     st.download_button(
@@ -21,11 +21,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.venue import load_venue, list_venues
-from src.position import get_seat_position, list_available_rows
-from src.reference import select_references, format_reference_selection
+from src.position import classify_angle, get_seat_position, list_available_rows, load_coordinates
 from src.prompt import build_prompt, build_negative_prompt, format_prompt_output
 
 
+def dumps_json(data) -> str:
+    """Serialize output data as indented JSON."""
+    return json.dumps(data, indent=2)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate view-from-seat prompts and reference selections"
@@ -78,7 +82,7 @@ def main():
     parser.add_argument(
         "--copy-prompt",
         action="store_true",
-        help="Copy positive prompt to clipboard (macOS only)"
+        help="Copy positive prompt to clipboard (uses pyperclip if installed, else macOS pbcopy)"
     )
     parser.add_argument(
         "--output", "-o",
@@ -107,10 +111,15 @@ def main():
         sys.exit(1)
 
     csv_path = project_root / venue.csv_path
+    coords = load_coordinates(
+        csv_path,
+        venue.stage_position["x"],
+        venue.stage_position["y"]
+    )
 
     # Handle list rows
     if args.list_rows:
-        rows = list_available_rows(csv_path, args.section)
+        rows = list_available_rows(csv_path, args.section, coords=coords)
         print(f"Available rows in {args.section}:")
         print(f"  Rows {min(rows)} - {max(rows)} ({len(rows)} total)")
         return
@@ -127,7 +136,7 @@ def main():
 
     if position is None:
         print(f"Error: Row {args.row} not found in section {args.section}")
-        available = list_available_rows(csv_path, args.section)
+        available = list_available_rows(csv_path, args.section, coords=coords)
         if available:
             print(f"Available rows: {min(available)} - {max(available)}")
         sys.exit(1)
@@ -136,19 +145,15 @@ def main():
     if args.angle is not None:
         position.angle = args.angle
         # Recalculate angle type
-        if args.angle < -15:
-            position.angle_type = "left"
-        elif args.angle > 15:
-            position.angle_type = "right"
-        else:
-            position.angle_type = "center"
-
-    # Select reference images
+        position.angle_type = classify_angle(args.angle)
+
+    # Select reference images (imported here since NumPy adds startup time
+    # the list commands don't need)
+    from src.reference import select_references, format_reference_selection
     references = select_references(
         position,
-        venue.reference_images,
-        max_results=args.refs,
-        project_root=project_root
+        venue.get_reference_set(project_root),
+        max_results=args.refs
     )
 
     # Build prompts
@@ -190,13 +195,12 @@ def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{venue.id}_{position.section}_row{position.row}_{timestamp}.json"
         output_path = outputs_dir / filename
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2)
+        output_path.write_text(dumps_json(output_data), encoding="utf-8")
         print(f"[Saved to {output_path}]")
 
     # Output
     if args.json:
-        print(json.dumps(output_data, indent=2))
+        print(dumps_json(output_data))
     else:
         print("\n" + "=" * 60)
         print(f"VIEW FROM SEAT: {venue.name}")
@@ -223,15 +227,20 @@ def main():
         print("6. Run generation!")
         print("=" * 60)
 
-    # Copy to clipboard (macOS)
+    # Copy to clipboard (pyperclip if installed, else macOS pbcopy)
     if args.copy_prompt:
         try:
-            import subprocess
-            subprocess.run(
-                ["pbcopy"],
-                input=positive_prompt.encode(),
-                check=True
-            )
+            try:
+                import pyperclip
+            except ImportError:
+                import subprocess
+                subprocess.run(
+                    ["pbcopy"],
+                    input=positive_prompt.encode(),
+                    check=True
+                )
+            else:
+                pyperclip.copy(positive_prompt)
             print("\n[Positive prompt copied to clipboard!]")
         except Exception as e:
             print(f"\n[Could not copy to clipboard: {e}]")
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers.
+"""
+
+import sys
+
+# Slotted dataclasses (smaller, faster attribute access) need Python 3.10+
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -5,11 +5,33 @@ Parses CSV coordinates and calculates camera positions for seats.
 
 import csv
 import math
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
 
 
+# Row position (fraction of the row range) boundaries for front/middle/back
+_DISTANCE_BOUNDS = (0.3, 0.65)
+_DISTANCE_TYPES = ("front", "middle", "back")
+
+
+def classify_distance(row: int, min_row: int = 1, max_row: int = 70) -> str:
+    """Categorize row into front/middle/back."""
+    position = (row - min_row) / (max_row - min_row)
+    return _DISTANCE_TYPES[bisect_right(_DISTANCE_BOUNDS, position)]
+
+
+def classify_angle(angle: float) -> str:
+    """Categorize angle into left/center/right (center is -15 to +15 inclusive)."""
+    if angle < -15:
+        return "left"
+    if angle > 15:
+        return "right"
+    return "center"
+
+
 @dataclass
 class SeatPosition:
     """Represents a seat's position and viewing characteristics."""
@@ -34,10 +56,27 @@ class CoordinateSystem:
     def _load_csv(self, csv_path: Path):
         """Load coordinates from CSV file."""
         with open(csv_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                section = row.get("SECTION", "").strip()
-                row_num = row.get("ROW", "").strip()
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Without SECTION/ROW columns (or an empty file) no row is usable
+            if "SECTION" not in header or "ROW" not in header:
+                return
+
+            # Resolve column positions once instead of building a dict per row;
+            # a missing X or Y column means 0
+            section_col = header.index("SECTION")
+            row_col = header.index("ROW")
+            x_col = header.index("X") if "X" in header else None
+            y_col = header.index("Y") if "Y" in header else None
+            min_fields = max(col for col in (section_col, row_col, x_col, y_col) if col is not None) + 1
+
+            rows = self.rows
+            for record in reader:
+                if len(record) < min_fields:
+                    continue
+
+                section = record[section_col].strip()
+                row_num = record[row_col].strip()
 
                 if not section or not row_num:
                     continue
@@ -48,22 +87,14 @@ class CoordinateSystem:
                 except ValueError:
                     row_int = row_num  # Keep as string for GA, etc.
 
-                # Parse X coordinate (handle comma formatting)
-                x_str = row.get("X", "0").replace(",", "")
-                try:
-                    x = float(x_str)
-                except ValueError:
-                    continue
-
-                # Parse Y coordinate
-                y_str = row.get("Y", "0").replace(",", "")
+                # Parse X and Y coordinates (handle comma formatting)
                 try:
-                    y = float(y_str)
+                    x = float(record[x_col].replace(",", "")) if x_col is not None else 0.0
+                    y = float(record[y_col].replace(",", "")) if y_col is not None else 0.0
                 except ValueError:
                     continue
 
-                key = (section, row_int)
-                self.rows[key] = {"x": x, "y": y}
+                rows[(section, row_int)] = {"x": x, "y": y}
 
     def get_row_position(self, section: str, row: int) -> Optional[dict]:
         """Get the X, Y coordinates for a specific row."""
@@ -93,24 +124,42 @@ class CoordinateSystem:
 
     def get_distance_type(self, row: int, min_row: int = 1, max_row: int = 70) -> str:
         """Categorize row into front/middle/back."""
-        total_rows = max_row - min_row
-        position = (row - min_row) / total_rows
-
-        if position < 0.3:
-            return "front"
-        elif position < 0.65:
-            return "middle"
-        else:
-            return "back"
+        return classify_distance(row, min_row, max_row)
 
     def get_angle_type(self, angle: float) -> str:
         """Categorize angle into left/center/right."""
-        if angle < -15:
-            return "left"
-        elif angle > 15:
-            return "right"
-        else:
-            return "center"
+        return classify_angle(angle)
+
+
+@lru_cache(maxsize=8)
+def _load_coordinates(
+    csv_path: str,
+    mtime: float,
+    stage_x: float,
+    stage_y: float
+) -> CoordinateSystem:
+    """Build a CoordinateSystem; mtime is part of the key so edits reload."""
+    return CoordinateSystem(Path(csv_path), stage_x, stage_y)
+
+
+def load_coordinates(
+    csv_path: Path,
+    stage_x: float = 0.0,
+    stage_y: float = 0.0
+) -> CoordinateSystem:
+    """
+    Load coordinates for a venue, reusing the parsed CSV until it changes.
+
+    Args:
+        csv_path: Path to coordinates CSV
+        stage_x: X coordinate of stage center
+        stage_y: Y coordinate of stage center
+
+    Returns:
+        Cached CoordinateSystem (shared between callers, do not modify)
+    """
+    csv_path = Path(csv_path).resolve()
+    return _load_coordinates(str(csv_path), csv_path.stat().st_mtime, stage_x, stage_y)
 
 
 def get_seat_position(
@@ -135,7 +184,7 @@ def get_seat_position(
     Returns:
         SeatPosition object or None if row not found
     """
-    coords = CoordinateSystem(csv_path, stage_x, stage_y)
+    coords = load_coordinates(csv_path, stage_x, stage_y)
     pos = coords.get_row_position(section, row)
 
     if pos is None:
@@ -160,16 +209,25 @@ def get_seat_position(
     )
 
 
-def list_available_rows(csv_path: Path, section: str = "RESERVED") -> list:
-    """List all available row numbers for a section."""
-    rows = []
-    with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get("SECTION", "").strip() == section:
-                try:
-                    row_num = int(row.get("ROW", "").strip())
-                    rows.append(row_num)
-                except ValueError:
-                    pass
-    return sorted(rows)
+def list_available_rows(
+    csv_path: Path,
+    section: str = "RESERVED",
+    coords: Optional[CoordinateSystem] = None
+) -> list:
+    """
+    List all available row numbers for a section.
+
+    Args:
+        csv_path: Path to coordinates CSV
+        section: Section name (e.g., "RESERVED")
+        coords: Optional already-loaded coordinates to read rows from
+
+    Returns:
+        Sorted list of numeric row numbers
+    """
+    if coords is None:
+        coords = load_coordinates(csv_path)
+    return sorted(
+        row for (row_section, row) in coords.rows
+        if row_section == section and isinstance(row, int)
+    )
@@ -3,11 +3,57 @@ Prompt generation.
 Creates position-aware prompts for image generation.
 """
 
-from typing import Optional
-from .position import SeatPosition
+from functools import lru_cache
+from typing import Optional, Tuple
+from .position import SeatPosition, classify_angle, classify_distance
 from .venue import VenueConfig
 
 
+# Technical photography terms appended to full prompts
+_TECHNICAL_TERMS = (
+    "professional concert photography",
+    "wide panoramic shot",
+    "8k resolution",
+    "highly detailed",
+    "natural lighting"
+)
+
+# Fallbacks for venues that don't describe a distance/angle type
+_DEFAULT_DISTANCE_DESCRIPTIONS = {
+    "front": "close to stage, looking up at performers",
+    "middle": "mid-distance from stage, balanced view",
+    "back": "far from stage, elevated panoramic view",
+}
+_DEFAULT_ANGLE_DESCRIPTIONS = {
+    "left": "viewing from left side of venue",
+    "center": "center view of stage",
+    "right": "viewing from right side of venue",
+}
+
+
+@lru_cache(maxsize=256)
+def _venue_fragments(
+    venue: VenueConfig,
+    distance_type: str,
+    angle_type: str
+) -> Tuple[str, ...]:
+    """
+    Position and venue prompt fragments.
+
+    Only a handful of distance/angle combinations exist per venue, so the
+    fragments are built once per combination and reused.
+    """
+    # Venue descriptions, falling back to generic ones
+    distance_desc = venue.distance_descriptions.get(distance_type) or _DEFAULT_DISTANCE_DESCRIPTIONS.get(
+        distance_type, _DEFAULT_DISTANCE_DESCRIPTIONS["back"]
+    )
+    angle_desc = venue.angle_descriptions.get(angle_type) or _DEFAULT_ANGLE_DESCRIPTIONS.get(
+        angle_type, _DEFAULT_ANGLE_DESCRIPTIONS["center"]
+    )
+
+    return (distance_desc, angle_desc, *venue.prompt_elements)
+
+
 def build_prompt(
     position: SeatPosition,
     venue: VenueConfig,
@@ -24,56 +70,12 @@ def build_prompt(
     Returns:
         Complete prompt string
     """
-    parts = []
-
-    # Start with base venue description
-    parts.append(f"Photorealistic view from audience seating at {venue.name}")
-
-    # Add position-specific descriptions
-    distance_desc = venue.get_distance_description(position.distance_type)
-    if distance_desc:
-        parts.append(distance_desc)
-    else:
-        # Fallback descriptions
-        if position.distance_type == "front":
-            parts.append("close to stage, looking up at performers")
-        elif position.distance_type == "middle":
-            parts.append("mid-distance from stage, balanced view")
-        else:
-            parts.append("far from stage, elevated panoramic view")
-
-    # Add angle description
-    angle_desc = venue.get_angle_description(position.angle_type)
-    if angle_desc:
-        parts.append(angle_desc)
-    else:
-        # Fallback descriptions
-        if position.angle_type == "left":
-            parts.append("viewing from left side of venue")
-        elif position.angle_type == "right":
-            parts.append("viewing from right side of venue")
-        else:
-            parts.append("center view of stage")
-
-    # Add venue-specific elements
-    elements = venue.get_prompt_elements()
-    if elements:
-        parts.extend(elements)
-
-    # Add technical photography terms
-    if include_technical:
-        parts.extend([
-            "professional concert photography",
-            "wide panoramic shot",
-            "8k resolution",
-            "highly detailed",
-            "natural lighting"
-        ])
-
-    # Join with commas
-    prompt = ", ".join(parts)
-
-    return prompt
+    return ", ".join((
+        # Start with base venue description
+        f"Photorealistic view from audience seating at {venue.name}",
+        *_venue_fragments(venue, position.distance_type, position.angle_type),
+        *(_TECHNICAL_TERMS if include_technical else ())
+    ))
 
 
 def build_negative_prompt(venue: VenueConfig) -> str:
@@ -86,7 +88,7 @@ def build_negative_prompt(venue: VenueConfig) -> str:
     Returns:
         Negative prompt string
     """
-    base_negative = venue.get_negative_prompt()
+    base_negative = venue.negative_prompt
 
     if base_negative:
         return base_negative
@@ -116,54 +118,20 @@ def build_row_specific_prompt(
     Returns:
         Complete prompt string
     """
-    # Determine distance type from row
-    min_row = venue.row_range.get("min", 1)
-    max_row = venue.row_range.get("max", 70)
-    total_rows = max_row - min_row
-    position_pct = (row - min_row) / total_rows
-
-    if position_pct < 0.3:
-        distance_type = "front"
-    elif position_pct < 0.65:
-        distance_type = "middle"
-    else:
-        distance_type = "back"
-
-    # Determine angle type
-    if angle < -15:
-        angle_type = "left"
-    elif angle > 15:
-        angle_type = "right"
-    else:
-        angle_type = "center"
-
-    parts = []
-
-    # Base description
-    parts.append(f"Photorealistic view from row {row} at {venue.name}")
-
-    # Distance description
-    distance_desc = venue.get_distance_description(distance_type)
-    if distance_desc:
-        parts.append(distance_desc)
-
-    # Angle description
-    angle_desc = venue.get_angle_description(angle_type)
-    if angle_desc:
-        parts.append(angle_desc)
-
-    # Venue elements
-    parts.extend(venue.get_prompt_elements())
-
-    # Technical terms
-    parts.extend([
-        "professional concert photography",
-        "wide panoramic shot",
-        "8k resolution",
-        "highly detailed"
-    ])
-
-    return ", ".join(parts)
+    # Determine distance and angle types
+    distance_type = classify_distance(
+        row,
+        venue.row_range.get("min", 1),
+        venue.row_range.get("max", 70)
+    )
+    angle_type = classify_angle(angle)
+
+    return ", ".join((
+        f"Photorealistic view from row {row} at {venue.name}",
+        *_venue_fragments(venue, distance_type, angle_type),
+        # Technical terms (without the lighting term)
+        *_TECHNICAL_TERMS[:4]
+    ))
 
 
 def format_prompt_output(
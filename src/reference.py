@@ -3,15 +3,24 @@ Reference image selection.
 Selects the best reference images based on target seat position.
 """
 
+import heapq
 import math
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
+
+from ._compat import DATACLASS_OPTIONS
 from .position import SeatPosition
 
+# Below this many references NumPy is fast enough and the JIT warm-up
+# isn't worth it
+_NUMBA_MIN_REFERENCES = 4096
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ReferenceMatch:
     """A reference image with its match score."""
     path: str
@@ -47,24 +56,181 @@ def calculate_distance(
     Returns:
         Combined weighted distance score (lower is better)
     """
+    # Weighted Euclidean distance
+    return math.sqrt(_calculate_sqdistance(
+        target_row, target_angle, ref_row, ref_angle, row_weight, angle_weight
+    ))
+
+
+def _calculate_sqdistance(
+    target_row: int,
+    target_angle: float,
+    ref_row: int,
+    ref_angle: float,
+    row_weight: float = 2.0,
+    angle_weight: float = 1.0
+) -> float:
+    """Squared calculate_distance; orders references the same, without the sqrt."""
     # Normalize row difference (rows typically 1-70, so divide by 70)
     row_diff = abs(target_row - ref_row) / 70.0
 
     # Normalize angle difference (angles typically -45 to +45, so divide by 90)
     angle_diff = abs(target_angle - ref_angle) / 90.0
 
-    # Weighted Euclidean distance
-    distance = math.sqrt(
-        (row_weight * row_diff) ** 2 +
-        (angle_weight * angle_diff) ** 2
-    )
+    return (row_weight * row_diff) ** 2 + (angle_weight * angle_diff) ** 2
+
 
-    return distance
+def _dist_and_topk(rows, angles, target_row, target_angle, k, out_idx, out_dist):
+    """
+    Squared distances and top-k selection fused into one pass.
+
+    Same weighting as calculate_distance (squared), with no temporary
+    arrays. out_idx/out_dist (length k) receive the best indices and their
+    squared distances, best first; earlier references win ties. Returns the
+    number of entries filled. See _compiled_dist_and_topk.
+    """
+    filled = 0
+    for i in range(rows.shape[0]):
+        row_term = 2.0 * abs(target_row - rows[i]) / 70.0
+        angle_term = abs(target_angle - angles[i]) / 90.0
+        sqdistance = row_term * row_term + angle_term * angle_term
+
+        if filled < k:
+            j = filled
+            filled += 1
+        elif sqdistance < out_dist[k - 1]:
+            j = k - 1
+        else:
+            continue
+
+        # Insert in order; strict < keeps earlier indices ahead on ties
+        while j > 0 and sqdistance < out_dist[j - 1]:
+            out_dist[j] = out_dist[j - 1]
+            out_idx[j] = out_idx[j - 1]
+            j -= 1
+        out_dist[j] = sqdistance
+        out_idx[j] = i
+
+    return filled
+
+
+@lru_cache(maxsize=None)
+def _compiled_dist_and_topk():
+    """
+    _dist_and_topk compiled with numba, or None if numba isn't installed.
+
+    numba is optional and slow to import, so it's only loaded the first
+    time a reference set is large enough to use it.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True)(_dist_and_topk)
+
+
+class ReferenceSet:
+    """
+    A venue's reference images as parallel arrays/lists, one entry per image.
+
+    Built once per venue (see VenueConfig.get_reference_set) so matching a
+    seat is a few vectorized operations instead of a Python loop, and only
+    the selected references become ReferenceMatch objects.
+    """
+
+    def __init__(self, reference_images: List[dict], project_root: Optional[Path] = None):
+        if project_root is None:
+            project_root = Path(__file__).parent.parent
+
+        self.project_root = project_root
+
+        # Config values as written, reported on matches, and the image and
+        # depth map paths resolved once rather than per match
+        self.row_values = []
+        self.angle_values = []
+        self.descriptions = []
+        self.paths = []
+        self.depth_paths = []
+
+        # One pass over the config dicts, looking each key up once
+        for ref in reference_images:
+            position = ref["position"]
+            path_str = ref["path"]
+
+            self.row_values.append(position["row"])
+            self.angle_values.append(position["angle"])
+            self.descriptions.append(ref.get("description", ""))
+
+            # Resolve path relative to project root
+            self.paths.append(str(project_root / path_str))
+
+            # Compute depth map path (same name with _depth suffix in depth_maps folder)
+            ref_path = Path(path_str)
+            depth_filename = f"{ref_path.stem}_depth.png"
+            self.depth_paths.append(
+                str(project_root / ref_path.parent / "depth_maps" / depth_filename)
+            )
+
+        # Float copies for the distance math
+        self.rows = np.array(self.row_values, dtype=np.float64)
+        self.angles = np.array(self.angle_values, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def sqdistances(
+        self,
+        target_row: int,
+        target_angle: float,
+        row_weight: float = 2.0,
+        angle_weight: float = 1.0
+    ) -> np.ndarray:
+        """
+        Squared weighted distance to every reference.
+
+        Same formula as calculate_distance without the sqrt, which doesn't
+        change the ranking; take the sqrt of selected scores only. Scalar
+        targets give shape (N,); arrays of M targets give shape (M, N).
+        """
+        target_row = np.asarray(target_row, dtype=np.float64)[..., None]
+        target_angle = np.asarray(target_angle, dtype=np.float64)[..., None]
+        row_diff = np.abs(target_row - self.rows) / 70.0
+        angle_diff = np.abs(target_angle - self.angles) / 90.0
+        return (row_weight * row_diff) ** 2 + (angle_weight * angle_diff) ** 2
+
+    def match(self, idx: int, distance: float) -> ReferenceMatch:
+        """Build the ReferenceMatch for reference idx."""
+        return ReferenceMatch(
+            path=self.paths[idx],
+            row=self.row_values[idx],
+            angle=self.angle_values[idx],
+            distance=float(distance),
+            description=self.descriptions[idx],
+            depth_path=self.depth_paths[idx]
+        )
+
+    def best_match(self, target_row: int, target_angle: float) -> Optional[ReferenceMatch]:
+        """Single closest reference in one pass (argmin keeps the first of ties)."""
+        if not len(self):
+            return None
+        sqdistances = self.sqdistances(target_row, target_angle)
+        idx = int(np.argmin(sqdistances))
+        return self.match(idx, math.sqrt(sqdistances[idx]))
+
+
+def _as_reference_set(
+    reference_images: Union[List[dict], ReferenceSet],
+    project_root: Optional[Path] = None
+) -> ReferenceSet:
+    """Use a prebuilt ReferenceSet as is, or build one from config dicts."""
+    if isinstance(reference_images, ReferenceSet):
+        return reference_images
+    return ReferenceSet(reference_images, project_root)
 
 
 def select_references(
     target_position: SeatPosition,
-    reference_images: List[dict],
+    reference_images: Union[List[dict], ReferenceSet],
     max_results: int = 3,
     project_root: Optional[Path] = None
 ) -> List[ReferenceMatch]:
@@ -73,55 +239,100 @@ def select_references(
 
     Args:
         target_position: The target seat position
-        reference_images: List of reference image configs from venue YAML
+        reference_images: Reference image configs from venue YAML, or a
+            prebuilt ReferenceSet (which already carries its project root)
         max_results: Maximum number of references to return (default 3)
         project_root: Optional project root path for resolving image paths
 
     Returns:
         List of ReferenceMatch objects, sorted by distance (best first)
     """
-    if project_root is None:
-        project_root = Path(__file__).parent.parent
+    refs = _as_reference_set(reference_images, project_root)
+
+    if not len(refs):
+        return []
+
+    # No selection needed for the single best
+    if max_results == 1:
+        return [refs.best_match(target_position.row, target_position.angle)]
+
+    # Large sets: one fused pass instead of NumPy temporaries plus a heap
+    dist_and_topk = None
+    if len(refs) >= _NUMBA_MIN_REFERENCES and max_results > 1:
+        dist_and_topk = _compiled_dist_and_topk()
+    if dist_and_topk is not None:
+        k = min(max_results, len(refs))
+        out_idx = np.empty(k, dtype=np.int64)
+        out_dist = np.empty(k, dtype=np.float64)
+        dist_and_topk(
+            refs.rows, refs.angles,
+            float(target_position.row), float(target_position.angle),
+            k, out_idx, out_dist
+        )
+        return [
+            refs.match(int(idx), math.sqrt(sqdistance))
+            for idx, sqdistance in zip(out_idx, out_dist)
+        ]
 
-    matches = []
+    sqdistances = refs.sqdistances(target_position.row, target_position.angle)
 
-    for ref in reference_images:
-        ref_row = ref["position"]["row"]
-        ref_angle = ref["position"]["angle"]
+    # Partial selection of the k best; the index breaks ties so equal
+    # distances (e.g. mirrored refs) keep config order
+    best = heapq.nsmallest(max_results, zip(sqdistances.tolist(), range(len(refs))))
 
-        distance = calculate_distance(
-            target_position.row,
-            target_position.angle,
-            ref_row,
-            ref_angle
-        )
+    return [refs.match(idx, math.sqrt(sqdistance)) for sqdistance, idx in best]
 
-        # Resolve path relative to project root
-        path = str(project_root / ref["path"])
 
-        # Compute depth map path (same name with _depth suffix in depth_maps folder)
-        ref_path = Path(ref["path"])
-        depth_filename = f"{ref_path.stem}_depth.png"
-        depth_path = str(project_root / ref_path.parent / "depth_maps" / depth_filename)
+def select_references_batch(
+    target_rows: np.ndarray,
+    target_angles: np.ndarray,
+    reference_images: Union[List[dict], ReferenceSet],
+    max_results: int = 3,
+    project_root: Optional[Path] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select the best matching references for many target seats at once.
+
+    Computes the full (targets x references) distance matrix in one
+    vectorized pass, for callers that score a grid of seats against the
+    same references.
+
+    Args:
+        target_rows: Row numbers of the target seats, shape (M,) (a scalar
+            counts as one seat)
+        target_angles: Angles of the target seats in degrees, same shape
+        reference_images: Reference image configs from venue YAML, or a
+            prebuilt ReferenceSet
+        max_results: Maximum number of references per target (default 3)
+        project_root: Optional project root path for resolving image paths
 
-        matches.append(ReferenceMatch(
-            path=path,
-            row=ref_row,
-            angle=ref_angle,
-            distance=distance,
-            description=ref.get("description", ""),
-            depth_path=depth_path
-        ))
+    Returns:
+        (indices, distances), both of shape (M, min(max_results, N)), best
+        first per target. Indices are positions in reference_images (config
+        order); distances are the combined distance scores. Pass a prebuilt
+        ReferenceSet to turn them into ReferenceMatch objects with
+        ReferenceSet.match(idx, distance).
+    """
+    target_rows = np.atleast_1d(np.asarray(target_rows, dtype=np.float64))
+    target_angles = np.atleast_1d(np.asarray(target_angles, dtype=np.float64))
+    if target_rows.ndim != 1 or target_rows.shape != target_angles.shape:
+        raise ValueError(
+            f"target_rows and target_angles must be 1-D with the same length, "
+            f"got shapes {target_rows.shape} and {target_angles.shape}"
+        )
 
-    # Sort by distance (best matches first)
-    matches.sort(key=lambda m: m.distance)
+    refs = _as_reference_set(reference_images, project_root)
+    sqdistances = refs.sqdistances(target_rows, target_angles)
 
-    return matches[:max_results]
+    # Stable sort keeps config order for ties, matching select_references
+    indices = np.argsort(sqdistances, axis=1, kind="stable")[:, :max_results]
+    distances = np.sqrt(np.take_along_axis(sqdistances, indices, axis=1))
+    return indices, distances
 
 
 def get_best_reference(
     target_position: SeatPosition,
-    reference_images: List[dict],
+    reference_images: Union[List[dict], ReferenceSet],
     project_root: Optional[Path] = None
 ) -> Optional[ReferenceMatch]:
     """
@@ -129,19 +340,15 @@ def get_best_reference(
 
     Args:
         target_position: The target seat position
-        reference_images: List of reference image configs from venue YAML
+        reference_images: Reference image configs from venue YAML, or a
+            prebuilt ReferenceSet
         project_root: Optional project root path
 
     Returns:
         Best matching ReferenceMatch or None if no references available
     """
-    matches = select_references(
-        target_position,
-        reference_images,
-        max_results=1,
-        project_root=project_root
-    )
-    return matches[0] if matches else None
+    refs = _as_reference_set(reference_images, project_root)
+    return refs.best_match(target_position.row, target_position.angle)
 
 
 def format_reference_selection(matches: List[ReferenceMatch]) -> str:
@@ -3,16 +3,52 @@ Scraper for A View From My Seat website.
 Fetches venue sections and seat view photos.
 """
 
+import os
 import re
+import shutil
+import threading
 import time
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
 from urllib.parse import quote_plus
 
-
-@dataclass
+from ._compat import DATACLASS_OPTIONS
+
+# lxml (libxml2) parses several times faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+# Optional on-disk cache for fetched pages
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Patterns for /section-XXX/row-YYY/seat-ZZZ/ parts of photo URLs
+_SECTION_RE = re.compile(r'section[/-]([^/]+)', re.IGNORECASE)
+_ROW_RE = re.compile(r'row[/-]([^/]+)', re.IGNORECASE)
+_SEAT_RE = re.compile(r'seat[/-]([^/]+)', re.IGNORECASE)
+# Photo count text like "(34)"
+_PAREN_COUNT_RE = re.compile(r'\((\d+)\)')
+# First number in a section name, for numeric sorting
+_DIGIT_RE = re.compile(r'(\d+)')
+# URL separators that stand for spaces in seat info
+_SEAT_TRANSLATE = str.maketrans({"-": " ", "+": " "})
+
+# Build only the parts of listing pages that get queried (with descendants),
+# instead of a tree for the whole page
+_VENUE_LINKS = SoupStrainer("a", href=re.compile(r"/venue/"))
+_SECTION_CONTAINERS = SoupStrainer(attrs={"section_name": True})
+_PHOTO_LINKS = SoupStrainer("a", href=re.compile(r"/photo/"))
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class SeatPhoto:
     """Represents a photo from a specific seat."""
     image_url: str
@@ -24,7 +60,7 @@ class SeatPhoto:
     photo_page_url: str
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Section:
     """Represents a venue section."""
     name: str
@@ -32,6 +68,24 @@ class Section:
     url: str
 
 
+class _RateLimiter:
+    """Spaces request start times at least `interval` seconds apart, across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            slot = max(time.monotonic(), self._next_slot)
+            self._next_slot = slot + self.interval
+        remaining = slot - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
 class AVFMSScraper:
     """Scraper for aviewfrommyseat.com"""
 
@@ -42,24 +96,70 @@ class AVFMSScraper:
         "Accept-Language": "en-US,en;q=0.5",
     }
 
-    def __init__(self, delay: float = 1.0):
+    def __init__(self, delay: float = 1.0, cache_name: Optional[str] = ".scraper_cache"):
         """
         Initialize scraper with rate limiting.
 
         Args:
             delay: Seconds to wait between requests (be respectful)
+            cache_name: On-disk cache for HTML pages, used when requests-cache
+                is installed. None disables caching.
         """
-        self.delay = delay
-        self.session = requests.Session()
+        self._rate_limiter = _RateLimiter(delay)
+        if cache_name and requests_cache is not None:
+            # Cache pages only; images are large and fetched once anyway
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                expire_after=86400,
+                allowable_methods=("GET",),
+                filter_fn=lambda response: "text/html" in response.headers.get("Content-Type", "")
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update(self.HEADERS)
 
-    def _get(self, url: str) -> Optional[BeautifulSoup]:
-        """Make a GET request and return parsed HTML."""
+    @property
+    def delay(self) -> float:
+        """Seconds between requests; changing it paces the next request."""
+        return self._rate_limiter.interval
+
+    @delay.setter
+    def delay(self, value: float):
+        self._rate_limiter.interval = value
+
+    def _is_cached(self, url: str) -> bool:
+        """Whether a GET for url can be answered from the page cache (fresh entries only)."""
+        cache = getattr(self.session, "cache", None)
+        if cache is None:
+            return False
+        try:
+            key = cache.create_key(requests.Request("GET", url))
+            cached = cache.get_response(key)
+        except (AttributeError, TypeError):
+            # Older requests-cache without this API: always rate limit
+            return False
+        # Expired entries stay on disk but are fetched live
+        return cached is not None and not cached.is_expired
+
+    def _get(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Make a GET request and return parsed HTML (optionally only matching elements)."""
         try:
-            time.sleep(self.delay)
+            # Cache hits don't touch the site, so skip the rate limit
+            if not self._is_cached(url):
+                self._rate_limiter.wait()
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "html.parser")
+            # Parse the raw bytes instead of decoding to response.text first.
+            # Pages without a declared charset are read as UTF-8, which this
+            # site serves (requests would assume ISO-8859-1 for text/html)
+            content_type = response.headers.get("Content-Type", "").lower()
+            encoding = response.encoding if "charset=" in content_type else "utf-8"
+            return BeautifulSoup(
+                response.content,
+                _HTML_PARSER,
+                from_encoding=encoding,
+                parse_only=parse_only
+            )
         except requests.RequestException as e:
             print(f"Request failed for {url}: {e}")
             return None
@@ -75,7 +175,7 @@ class AVFMSScraper:
             List of venue dicts with name and url
         """
         search_url = f"{self.BASE_URL}/search.php?q={quote_plus(query)}"
-        soup = self._get(search_url)
+        soup = self._get(search_url, parse_only=_VENUE_LINKS)
 
         if not soup:
             return []
@@ -116,7 +216,7 @@ class AVFMSScraper:
             venue_url += "/"
         sections_url = venue_url.rstrip("/") + "/sections/"
 
-        soup = self._get(sections_url)
+        soup = self._get(sections_url, parse_only=_SECTION_CONTAINERS)
         if not soup:
             return []
 
@@ -137,9 +237,10 @@ class AVFMSScraper:
 
             href = link.get("href", "")
 
-            # Extract photo count from text like "(34)"
-            container_text = container.get_text()
-            photo_match = re.search(r'\((\d+)\)', container_text)
+            # Extract photo count from text like "(34)", stopping at the
+            # first text node that has one instead of joining all text
+            count_text = container.find(string=_PAREN_COUNT_RE)
+            photo_match = _PAREN_COUNT_RE.search(count_text) if count_text else None
             photo_count = int(photo_match.group(1)) if photo_match else 0
 
             # Skip sections with no photos
@@ -156,7 +257,7 @@ class AVFMSScraper:
         # Sort by section name (try numeric sort if possible)
         def sort_key(s):
             # Try to extract number from section name for numeric sorting
-            match = re.search(r'(\d+)', s.name)
+            match = _DIGIT_RE.search(s.name)
             if match:
                 return (0, int(match.group(1)), s.name)
             return (1, 0, s.name)
@@ -177,7 +278,7 @@ class AVFMSScraper:
         Returns:
             List of SeatPhoto objects
         """
-        soup = self._get(section_url)
+        soup = self._get(section_url, parse_only=_PHOTO_LINKS)
         if not soup:
             return []
 
@@ -279,16 +380,16 @@ class AVFMSScraper:
         seat = None
 
         # Pattern: /section-XXX/row-YYY/seat-ZZZ/
-        section_match = re.search(r'section[/-]([^/]+)', url, re.IGNORECASE)
-        row_match = re.search(r'row[/-]([^/]+)', url, re.IGNORECASE)
-        seat_match = re.search(r'seat[/-]([^/]+)', url, re.IGNORECASE)
+        section_match = _SECTION_RE.search(url)
+        row_match = _ROW_RE.search(url)
+        seat_match = _SEAT_RE.search(url)
 
         if section_match:
-            section = section_match.group(1).replace("-", " ").replace("+", " ")
+            section = section_match.group(1).translate(_SEAT_TRANSLATE)
         if row_match:
-            row = row_match.group(1).replace("-", " ").replace("+", " ")
+            row = row_match.group(1).translate(_SEAT_TRANSLATE)
         if seat_match:
-            seat = seat_match.group(1).replace("-", " ").replace("+", " ")
+            seat = seat_match.group(1).translate(_SEAT_TRANSLATE)
 
         return section, row, seat
 
@@ -303,15 +404,39 @@ class AVFMSScraper:
         Returns:
             True if successful, False otherwise
         """
+        partial_path = f"{save_path}.part"
         try:
-            time.sleep(self.delay)
-            response = self.session.get(image_url, timeout=30)
-            response.raise_for_status()
+            self._rate_limiter.wait()
+            # Stream straight to disk instead of buffering the whole body,
+            # into a temp file so a failed transfer leaves nothing at save_path
+            with self.session.get(image_url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
 
-            with open(save_path, "wb") as f:
-                f.write(response.content)
+                with open(partial_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=64 * 1024)
 
+            os.replace(partial_path, save_path)
             return True
         except Exception as e:
             print(f"Failed to download {image_url}: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
             return False
+
+    def download_images(self, downloads: List[Tuple[str, str]], max_workers: int = 8) -> List[bool]:
+        """
+        Download several images concurrently.
+
+        Requests still start at most one per `delay` seconds, but their
+        transfers overlap instead of running back to back.
+
+        Args:
+            downloads: List of (image_url, save_path) pairs
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            List of success flags, in the same order as downloads
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.download_image(*item), downloads))
@@ -4,60 +4,110 @@ Loads venue YAML configs and provides access to venue data.
 """
 
 import yaml
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
+# libyaml's C loader parses much faster; fall back if PyYAML lacks it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class VenueConfig:
     """Represents a venue's configuration."""
 
     def __init__(self, config_path: Path):
         with open(config_path) as f:
-            self._config = yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=SafeLoader)
 
         self.id = self._config["venue"]["id"]
         self.name = self._config["venue"]["name"]
         self.venue_type = self._config["venue"]["type"]
+        self._reference_sets = {}
 
-    @property
+    @cached_property
     def csv_path(self) -> str:
         return self._config["coordinates"]["csv_path"]
 
-    @property
+    @cached_property
     def stage_position(self) -> dict:
         return self._config["coordinates"]["stage_position"]
 
-    @property
+    @cached_property
     def row_range(self) -> dict:
         return self._config["coordinates"]["row_range"]
 
-    @property
+    @cached_property
     def reference_images(self) -> list:
         return self._config["reference_images"]
 
-    @property
+    @cached_property
     def prompts(self) -> dict:
         return self._config["prompts"]
 
-    @property
+    @cached_property
     def output_config(self) -> dict:
         return self._config["output"]
 
+    @cached_property
+    def prompt_elements(self) -> tuple:
+        """Venue-specific prompt elements."""
+        return tuple(self.prompts.get("elements", []))
+
+    @cached_property
+    def negative_prompt(self) -> str:
+        """Negative prompt for this venue."""
+        return self.prompts.get("negative", "")
+
+    @cached_property
+    def distance_descriptions(self) -> dict:
+        """Descriptions keyed by front/middle/back."""
+        return dict(self.prompts.get("distance_descriptions", {}))
+
+    @cached_property
+    def angle_descriptions(self) -> dict:
+        """Descriptions keyed by left/center/right."""
+        return dict(self.prompts.get("angle_descriptions", {}))
+
+    def get_reference_set(self, project_root: Optional[Path] = None):
+        """
+        Get reference images prepared for matching, built once per project root.
+
+        Args:
+            project_root: Optional project root for resolving image paths
+
+        Returns:
+            ReferenceSet for this venue's reference images
+        """
+        from .reference import ReferenceSet
+
+        if project_root not in self._reference_sets:
+            self._reference_sets[project_root] = ReferenceSet(self.reference_images, project_root)
+        return self._reference_sets[project_root]
+
     def get_prompt_elements(self) -> list:
         """Get the list of venue-specific prompt elements."""
-        return self.prompts.get("elements", [])
+        return list(self.prompt_elements)
 
     def get_negative_prompt(self) -> str:
         """Get the negative prompt for this venue."""
-        return self.prompts.get("negative", "")
+        return self.negative_prompt
 
     def get_distance_description(self, distance_type: str) -> str:
         """Get description for front/middle/back distance."""
-        return self.prompts.get("distance_descriptions", {}).get(distance_type, "")
+        return self.distance_descriptions.get(distance_type, "")
 
     def get_angle_description(self, angle_type: str) -> str:
         """Get description for left/center/right angle."""
-        return self.prompts.get("angle_descriptions", {}).get(angle_type, "")
+        return self.angle_descriptions.get(angle_type, "")
+
+
+@lru_cache(maxsize=32)
+def _load_venue_config(config_path: Path, mtime: float) -> VenueConfig:
+    """Parse a venue config; mtime is part of the key so edits reload."""
+    return VenueConfig(config_path)
 
 
 def load_venue(venue_id: str, config_dir: Optional[Path] = None) -> VenueConfig:
@@ -69,7 +119,7 @@ def load_venue(venue_id: str, config_dir: Optional[Path] = None) -> VenueConfig:
         config_dir: Optional path to config directory. Defaults to project config/venues/
 
     Returns:
-        VenueConfig object
+        VenueConfig object (cached and shared between callers)
     """
     if config_dir is None:
         config_dir = Path(__file__).parent.parent / "config" / "venues"
@@ -79,7 +129,8 @@ def load_venue(venue_id: str, config_dir: Optional[Path] = None) -> VenueConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Venue config not found: {config_path}")
 
-    return VenueConfig(config_path)
+    config_path = config_path.resolve()
+    return _load_venue_config(config_path, config_path.stat().st_mtime)
 
 
 def list_venues(config_dir: Optional[Path] = None) -> list: